@@ -11,10 +11,12 @@ Handles license file selection and displays progress events for completing
 project setup.
 """
 
+import functools
+import os
+import shutil
 import sys
-from datetime import datetime
-from pathlib import Path
-from typing import Final
+import time
+from typing import Final, List, Tuple
 
 # ANSI Color Codes
 GREEN: Final[str] = "\033[32m"
@@ -24,23 +26,69 @@ BLUE: Final[str] = "\033[34m"
 BOLD: Final[str] = "\033[1m"
 NC: Final[str] = "\033[0m"  # No Color
 
+# License choice for projects that ship without a LICENSE file
+NOT_OPEN_SOURCE: Final[str] = "Not Open Source"
+
+# Month abbreviations for timestamps (same as strftime's %b in the C locale)
+MONTHS: Final[Tuple[str, ...]] = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _format_timestamp(now: int) -> str:
+    """Format a whole-second Unix time as DD-Mmm-YYYY HH:MM:SS (local time)."""
+    t = time.localtime(now)
+    return (
+        f"{t.tm_mday:02d}-{MONTHS[t.tm_mon - 1]}-{t.tm_year} "
+        f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    )
+
 
 def get_timestamp() -> str:
-    """Get current date and time in DD-Mmm-YYYY HH:MM:SS format."""
-    return datetime.now().strftime("%d-%b-%Y %H:%M:%S")
+    """Get current date and time in DD-Mmm-YYYY HH:MM:SS format.
 
+    The formatted string is reused for every call within the same second.
+    """
+    return _format_timestamp(int(time.time()))
 
-def print_event(emoji: str, message: str, color: str = "") -> None:
-    """Print formatted event message with timestamp and optional color.
+
+def format_event(emoji: str, message: str, color: str = "") -> str:
+    """Format event message with timestamp and optional color.
 
     Args:
         emoji: The emoji to display
         message: The message text
         color: ANSI color code (optional)
+
+    Returns:
+        The formatted event line
     """
     timestamp = get_timestamp()
     colored_msg = f"{color}{message}{NC}" if color else message
-    print(f"{emoji} {colored_msg} • {timestamp}")
+    return f"{emoji} {colored_msg} • {timestamp}"
+
+
+def print_event(emoji: str, message: str, color: str = "") -> None:
+    """Print formatted event message with timestamp and optional color.
+
+    Args:
+        emoji: The emoji to display
+        message: The message text
+        color: ANSI color code (optional)
+    """
+    print(format_event(emoji, message, color))
 
 
 def handle_license_file() -> None:
@@ -51,21 +99,26 @@ def handle_license_file() -> None:
     """
     selected_license: str = "{{ cookiecutter.license }}"
 
-    if selected_license == "Not Open Source":  # type: ignore[comparison-overlap]
+    # Collect license templates in a single directory pass
+    with os.scandir(".") as entries:
+        license_files: List[str] = [
+            entry.name
+            for entry in entries
+            if entry.name.startswith("LICENSE.") and entry.is_file()
+        ]
+
+    if selected_license == NOT_OPEN_SOURCE:
         # Remove all license templates for closed source projects
-        for license_file in Path(".").glob("LICENSE.*"):
-            license_file.unlink()
+        for license_file in license_files:
+            os.unlink(license_file)
         print_event("📋", "No open source license selected")
         return
 
     # Copy selected license template to LICENSE
-    license_source: Path = Path(f"LICENSE.{selected_license}")
-    license_dest: Path = Path("LICENSE")
+    license_source: str = f"LICENSE.{selected_license}"
 
-    if license_source.exists():
-        license_dest.write_text(
-            license_source.read_text(encoding="utf-8"), encoding="utf-8"
-        )
+    if license_source in license_files:
+        shutil.copyfile(license_source, "LICENSE")
         print_event(
             "📜", f"License file created: {YELLOW}{selected_license}{NC}", YELLOW
         )
@@ -74,50 +127,58 @@ def handle_license_file() -> None:
         return
 
     # Remove all license template files
-    for license_file in Path(".").glob("LICENSE.*"):
-        license_file.unlink()
+    for license_file in license_files:
+        os.unlink(license_file)
 
 
 def display_next_steps() -> None:
-    """Display instructions for completing project setup."""
+    """Display instructions for completing project setup.
+
+    The whole block is assembled first and written to stdout in one call.
+    """
     project_slug = "{{ cookiecutter.project_slug }}"
 
-    print()
-    print_event(
-        "✅", f"Project {GREEN}{project_slug}{NC} initialized successfully", GREEN
-    )
-    print_event(
-        "📦",
-        f"Generated: {CYAN}project.yaml, Taskfile.yml, README.md, .gitignore, "
-        f"LICENSE{NC}",
-        CYAN,
-    )
-    print_event("📝", f"Configuration: {BLUE}{project_slug}/project.yaml{NC}", BLUE)
-    print()
-    print_event("🚀", f"{BOLD}{CYAN}Next Steps:{NC}", CYAN)
-    print()
-    print(f"  1. cd {CYAN}{project_slug}{NC}")
-    print(f"  2. {CYAN}task generate{NC}           # Generate full project with Docker")
-    print(f"  3. {CYAN}task setup{NC}              # Setup development environment")
-    print(f"  4. {CYAN}task compliance{NC}         # Run code quality checks")
-    print()
-    print_event(
-        "💡",
-        f"Customize: Edit project.yaml and run {CYAN}task generate{NC} again",
-        YELLOW,
-    )
-    print_event(
-        "❓",
-        f"Help: {BLUE}https://github.com/broadsage/docker-scaffold/discussions{NC}",
-        BLUE,
-    )
-    print_event(
-        "📚",
-        f"Docs: {BLUE}https://github.com/broadsage/docker-scaffold/blob/main/"
-        f"README.md{NC}",
-        BLUE,
-    )
-    print()
+    out: List[str] = [
+        "",
+        format_event(
+            "✅", f"Project {GREEN}{project_slug}{NC} initialized successfully", GREEN
+        ),
+        format_event(
+            "📦",
+            f"Generated: {CYAN}project.yaml, Taskfile.yml, README.md, .gitignore, "
+            f"LICENSE{NC}",
+            CYAN,
+        ),
+        format_event(
+            "📝", f"Configuration: {BLUE}{project_slug}/project.yaml{NC}", BLUE
+        ),
+        "",
+        format_event("🚀", f"{BOLD}{CYAN}Next Steps:{NC}", CYAN),
+        "",
+        f"  1. cd {CYAN}{project_slug}{NC}",
+        f"  2. {CYAN}task generate{NC}           # Generate full project with Docker",
+        f"  3. {CYAN}task setup{NC}              # Setup development environment",
+        f"  4. {CYAN}task compliance{NC}         # Run code quality checks",
+        "",
+        format_event(
+            "💡",
+            f"Customize: Edit project.yaml and run {CYAN}task generate{NC} again",
+            YELLOW,
+        ),
+        format_event(
+            "❓",
+            f"Help: {BLUE}https://github.com/broadsage/docker-scaffold/discussions{NC}",
+            BLUE,
+        ),
+        format_event(
+            "📚",
+            f"Docs: {BLUE}https://github.com/broadsage/docker-scaffold/blob/main/"
+            f"README.md{NC}",
+            BLUE,
+        ),
+        "",
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main() -> None:
@@ -10,7 +10,20 @@ Validates inputs before project generation.
 """
 
 import re
+import string
 import sys
+from typing import FrozenSet, Final, Pattern
+
+# Project names: ASCII alphanumeric first character, then also '-' or '_'
+_NAME_FIRST_CHARS: Final[FrozenSet[str]] = frozenset(
+    string.ascii_letters + string.digits
+)
+_NAME_CHARS: Final[FrozenSet[str]] = _NAME_FIRST_CHARS | {"-", "_"}
+
+# Email pattern, compiled once at import (anchors implied by fullmatch())
+_EMAIL_RE: Final[Pattern[str]] = re.compile(
+    r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", re.ASCII
+)
 
 
 def validate_project_name(name: str) -> bool:
@@ -26,18 +39,19 @@ def validate_project_name(name: str) -> bool:
     Raises:
         ValueError: If name format is invalid
     """
+    # Cheap O(1) length checks before scanning the characters
     if not name:
         raise ValueError("Project name cannot be empty")
 
-    if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9-_]*$", name):
+    if len(name) > 100:
+        raise ValueError("Project name must be less than 100 characters")
+
+    if name[0] not in _NAME_FIRST_CHARS or not _NAME_CHARS.issuperset(name):
         raise ValueError(
             "Project name must start with alphanumeric character and "
             "contain only alphanumeric characters, hyphens, or underscores"
         )
 
-    if len(name) > 100:
-        raise ValueError("Project name must be less than 100 characters")
-
     return True
 
 
@@ -54,8 +68,7 @@ def validate_email(email: str) -> bool:
     Raises:
         ValueError: If email format is invalid
     """
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(email_pattern, email):
+    if not _EMAIL_RE.fullmatch(email):
         raise ValueError(f"Invalid email format: {email}")
     return True
 
@@ -73,13 +86,15 @@ def main() -> None:
         validate_email(maintainer_email)
 
         # Display info
-        print()
-        print("✅ Pre-generation validation successful!")
-        print()
-        print(f"  Project:     {project_name}")
-        print(f"  Email:       {maintainer_email}")
-        print(f"  Organization: {organization or 'Not specified'}")
-        print()
+        sys.stdout.write(
+            "\n"
+            "✅ Pre-generation validation successful!\n"
+            "\n"
+            f"  Project:     {project_name}\n"
+            f"  Email:       {maintainer_email}\n"
+            f"  Organization: {organization or 'Not specified'}\n"
+            "\n"
+        )
 
     except ValueError as e:
         print(f"\n❌ ERROR: {e}\n", file=sys.stderr)
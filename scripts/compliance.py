@@ -17,7 +17,7 @@ Requirements:
     - Python 3.8+
 
 Usage:
-    python compliance.py [check_name]
+    python compliance.py [check_name] [--skip-pull]
 
     Available checks:
         lint            - Run MegaLinter code quality checks
@@ -32,19 +32,57 @@ Exit Codes:
 """
 
 import argparse
+import io
+import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Final, List, Tuple
-
-# ANSI Color Codes & Python Constants
-RED: Final[str] = "\033[31m"
-GREEN: Final[str] = "\033[32m"
-YELLOW: Final[str] = "\033[33m"
-BLUE: Final[str] = "\033[34m"
-BOLD: Final[str] = "\033[1m"
-NC: Final[str] = "\033[0m"  # No Color
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from compliance_helpers import (
+    PROJECT_ROOT,
+    docker_recently_verified,
+    license_files_present,
+    mark_docker_verified,
+    pooled_container,
+    read_cached_fingerprint,
+    spdx_declarations,
+    spdx_fingerprint,
+    write_cached_fingerprint,
+)
+
+# Color support, decided once at import: a non-empty FORCE_COLOR wins over
+# everything else so any CI system can opt in ("0" opts out), a non-empty
+# NO_COLOR disables colors, GitHub Actions (whose log viewer renders ANSI) gets
+# them by default, otherwise they are used only when stdout is a terminal
+_FORCE_COLOR: Final[str] = os.environ.get("FORCE_COLOR", "")
+USE_COLOR: Final[bool] = (
+    _FORCE_COLOR != "0"
+    if _FORCE_COLOR
+    else not os.environ.get("NO_COLOR")
+    and (os.environ.get("GITHUB_ACTIONS") == "true" or sys.stdout.isatty())
+)
+
+# ANSI Color Codes & Python Constants (empty when colors are disabled)
+RED: Final[str] = "\033[31m" if USE_COLOR else ""
+GREEN: Final[str] = "\033[32m" if USE_COLOR else ""
+YELLOW: Final[str] = "\033[33m" if USE_COLOR else ""
+BLUE: Final[str] = "\033[34m" if USE_COLOR else ""
+BOLD: Final[str] = "\033[1m" if USE_COLOR else ""
+NC: Final[str] = "\033[0m" if USE_COLOR else ""  # No Color
 
 # Symbols
 CHECKMARK: Final[str] = "✔"
@@ -55,6 +93,16 @@ MEGALINTER_IMAGE: Final[str] = "oxsecurity/megalinter-cupcake:v9.2.0"
 REUSE_IMAGE: Final[str] = "docker.io/fsfe/reuse:latest"
 CONFORM_IMAGE: Final[str] = "ghcr.io/siderolabs/conform:latest"
 
+# Check names accepted on the command line
+CHECK_NAMES: Final[Tuple[str, ...]] = ("lint", "license", "conform", "all")
+
+# Images used by each check
+CHECK_IMAGES: Final[Dict[str, Tuple[str, ...]]] = {
+    "lint": (MEGALINTER_IMAGE,),
+    "license": (REUSE_IMAGE,),
+    "conform": (CONFORM_IMAGE,),
+}
+
 # Container Paths
 REPO_PATH: Final[str] = "/repo"
 DATA_PATH: Final[str] = "/data"
@@ -67,12 +115,50 @@ EXIT_SUCCESS: Final[int] = 0
 EXIT_FAILURE: Final[int] = 1
 EXIT_ERROR: Final[int] = 2
 
+# Longest changed-file list passed to MegaLinter; larger diffs lint everything
+# (a single environment string is capped at 128 KiB on Linux)
+MAX_FILES_TO_LINT_LENGTH: Final[int] = 100_000
+
+# Summary Table Layout (column widths, then the fixed parts of the table)
+CHECK_WIDTH: Final[int] = 18
+STATUS_WIDTH: Final[int] = 13
+MESSAGE_WIDTH: Final[int] = 50
+TABLE_HEADER: Final[str] = (
+    f"{BOLD}{BLUE}| {'Check':<{CHECK_WIDTH}} | "
+    f"{'Status':<{STATUS_WIDTH}} | {'Message':<{MESSAGE_WIDTH}} |{NC}"
+)
+TABLE_BORDER: Final[str] = (
+    f"{BLUE}|{'-' * (CHECK_WIDTH + 2)}|{'-' * (STATUS_WIDTH + 2)}|"
+    f"{'-' * (MESSAGE_WIDTH + 2)}|{NC}"
+)
+# Colored status cells, padded outside the color codes
+STATUS_CELLS: Final[Dict[str, str]] = {
+    status: f"{color}{label}{NC}{' ' * (STATUS_WIDTH - len(label))}"
+    for status, color, label in (
+        ("PASS", GREEN, f"PASS {CHECKMARK}"),
+        ("FAIL", RED, f"FAIL {MISSING}"),
+        ("SKIP", YELLOW, "SKIPPED"),
+    )
+}
+
 # Timeouts (seconds)
 DOCKER_VERSION_TIMEOUT: Final[int] = 5
 
+
+class CheckResult(NamedTuple):
+    """Outcome of one check, as shown in the summary table."""
+
+    check: str
+    status: str  # "PASS", "FAIL" or "SKIP"
+    message: str
+
+
 # Global State Tracking
 EXIT_CODES: List[int] = []
-SUMMARY_TABLE: List[Tuple[str, str, str]] = []  # (check, status, message)
+SUMMARY_TABLE: List[CheckResult] = []
+
+# Per-thread output buffer and pending results while checks run in parallel
+CHECK_STATE = threading.local()
 
 
 # Display Functions
@@ -86,26 +172,109 @@ def print_header(header: str) -> None:
     print(f"\n{BLUE}▶ {header} • {now}{NC}")
 
 
+def format_banner(msg: str) -> str:
+    """Format a prominent banner message with timestamp.
+
+    Args:
+        msg: The message to display in the banner.
+
+    Returns:
+        The banner, including its surrounding blank lines.
+    """
+    now: str = datetime.now().strftime("%d-%b-%Y %H:%M:%S")
+    return f"\n{BOLD}{BLUE}▶ {msg} • {now}{NC}\n"
+
+
 def print_banner(msg: str) -> None:
     """Print a prominent banner message with timestamp.
 
     Args:
         msg: The message to display in the banner.
     """
-    now: str = datetime.now().strftime("%d-%b-%Y %H:%M:%S")
-    print(f"\n{BOLD}{BLUE}▶ {msg} • {now}{NC}\n")
+    print(format_banner(msg))
+
+
+class ThreadRoutedStdout(io.TextIOBase):
+    """Stand-in for sys.stdout that routes writes to the calling thread's buffer.
+
+    Threads without a buffer (such as the main thread) write straight through
+    to the wrapped stream.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        buffer: Optional[io.StringIO] = getattr(CHECK_STATE, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self) -> None:
+        if getattr(CHECK_STATE, "buffer", None) is None:
+            self.stream.flush()
+
+
+def run_tool(cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess[Any]:
+    """Run a tool whose output is shown to the user.
+
+    Output normally goes straight to the terminal, and the tool is started
+    with posix_spawn where available (unless ``check`` is requested). While a
+    check runs in parallel, output is captured instead and appended to that
+    check's buffer so it is replayed together with the rest of the check's
+    output.
+
+    Args:
+        cmd: Command line to execute.
+        **kwargs: Extra arguments for subprocess.run.
+
+    Returns:
+        The completed process.
+    """
+    check: bool = kwargs.pop("check", False)
+    buffer: Optional[io.StringIO] = getattr(CHECK_STATE, "buffer", None)
+    if buffer is None:
+        # Nothing to capture, feed in or check: spawn the tool directly,
+        # skipping subprocess's fork/exec machinery
+        if not check and hasattr(os, "posix_spawnp") and set(kwargs) <= {"text"}:
+            pid: int = os.posix_spawnp(cmd[0], cmd, os.environ)
+            _, status = os.waitpid(pid, 0)
+            returncode: int = (
+                -os.WTERMSIG(status)
+                if os.WIFSIGNALED(status)
+                else os.WEXITSTATUS(status)
+            )
+            return subprocess.CompletedProcess(cmd, returncode)
+        return subprocess.run(cmd, check=check, **kwargs)
+
+    kwargs.update(
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace"
+    )
+    result: subprocess.CompletedProcess[str] = subprocess.run(
+        cmd, check=False, **kwargs
+    )
+    buffer.write(result.stdout)
+    # Raised only once the output is in the buffer
+    if check:
+        result.check_returncode()
+    return result
 
 
 # Container Engine Detection
 def detect_container_engine() -> str:
     """Detect and verify Docker availability.
 
+    A successful check is remembered for DOCKER_VERIFIED_TTL seconds, so
+    checks run back to back (e.g. one per task) only verify Docker once.
+
     Returns:
         The container engine command ('docker').
 
     Raises:
         SystemExit: If Docker is not available or not responding.
     """
+    # Skip the check if a recent run already verified Docker
+    if docker_recently_verified():
+        return "docker"
+
     try:
         result: subprocess.CompletedProcess[str] = subprocess.run(
             ["docker", "--version"],
@@ -115,6 +284,7 @@ def detect_container_engine() -> str:
             timeout=DOCKER_VERSION_TIMEOUT,
         )
         if "Docker version" in result.stdout:
+            mark_docker_verified()
             return "docker"
     except FileNotFoundError:
         print_banner(f"{RED}Docker not found in system PATH.{NC}")
@@ -135,6 +305,189 @@ def detect_container_engine() -> str:
     sys.exit(EXIT_ERROR)
 
 
+# Image Warm-up
+def pull_images(container_engine: str, images: List[str]) -> None:
+    """Pull the given images concurrently before any check runs.
+
+    Otherwise each image is pulled implicitly by its first ``run``, which
+    serializes the downloads behind the checks. Failures are reported but not
+    fatal; the check itself will surface a missing image.
+
+    Args:
+        container_engine: The container engine command to use (e.g., 'docker').
+        images: Images to pull.
+    """
+    print(f"{BLUE}Pulling {len(images)} image(s)...{NC}")
+
+    def pull(image: str) -> int:
+        try:
+            return subprocess.run(
+                [container_engine, "pull", "-q", image],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            ).returncode
+        except (OSError, subprocess.SubprocessError):
+            return EXIT_FAILURE
+
+    with ThreadPoolExecutor(max_workers=len(images)) as executor:
+        for image, returncode in zip(images, executor.map(pull, images)):
+            if returncode != EXIT_SUCCESS:
+                print(f"{YELLOW}Warning: Could not pull {image}.{NC}")
+
+
+# Git Helpers
+def changed_files(base_branch: str) -> Optional[List[str]]:
+    """List files added or modified since the branch forked from base_branch.
+
+    Covers committed, uncommitted and untracked (non-ignored) changes.
+    Deleted files are left out since there is nothing to lint.
+
+    Args:
+        base_branch: Branch to compare against.
+
+    Returns:
+        Paths relative to the project root, or None if git could not
+        determine the changes (callers should then check everything).
+    """
+    try:
+        merge_base: subprocess.CompletedProcess[str] = subprocess.run(
+            ["git", "merge-base", base_branch, "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if merge_base.returncode != EXIT_SUCCESS:
+            return None
+
+        diff: subprocess.CompletedProcess[str] = subprocess.run(
+            [
+                "git",
+                "diff",
+                "--name-only",
+                "-z",
+                "--diff-filter=d",
+                merge_base.stdout.strip(),
+            ],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        untracked: subprocess.CompletedProcess[str] = subprocess.run(
+            ["git", "ls-files", "-z", "--others", "--exclude-standard"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if diff.returncode != EXIT_SUCCESS or untracked.returncode != EXIT_SUCCESS:
+        return None
+
+    paths = diff.stdout.split("\0") + untracked.stdout.split("\0")
+    return sorted({path for path in paths if path})
+
+
+def has_changes(base_branch: str) -> bool:
+    """Tell whether anything changed since the branch forked from base_branch.
+
+    Relies on the exit status of ``git diff --quiet --merge-base`` (committed
+    and uncommitted changes), plus a check for untracked files. Fails open:
+    any git error counts as a change, so the caller runs its check.
+
+    Args:
+        base_branch: Branch to compare against.
+
+    Returns:
+        False only if git positively reports no changes.
+    """
+    try:
+        diff: subprocess.CompletedProcess[bytes] = subprocess.run(
+            ["git", "diff", "--quiet", "--merge-base", base_branch],
+            cwd=PROJECT_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        # 1 means changes; anything else is an error (e.g. unknown branch)
+        if diff.returncode != EXIT_SUCCESS:
+            return True
+        untracked: subprocess.CompletedProcess[str] = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return True
+    return untracked.returncode != EXIT_SUCCESS or bool(untracked.stdout.strip())
+
+
+def is_feature_branch() -> bool:
+    """Tell whether a pull request or a branch other than the default is checked.
+
+    Returns:
+        False on the default branch, or if the branch cannot be determined.
+    """
+    branch: str = get_current_branch()
+    return bool(branch) and branch != DEFAULT_BRANCH
+
+
+def get_current_branch() -> str:
+    """Return the name of the branch being checked, for display only.
+
+    Pull request builds check out a detached HEAD, so the branch name from
+    GITHUB_HEAD_REF is preferred when set.
+
+    Returns:
+        The branch name, or an empty string if it cannot be determined.
+    """
+    branch: str = os.environ.get("GITHUB_HEAD_REF", "")
+    if branch:
+        return branch
+    try:
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            ["git", "symbolic-ref", "--short", "-q", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return result.stdout.strip()
+
+
+def reuse_command(
+    container_engine: str, container_id: Optional[str], *args: str
+) -> List[str]:
+    """Build a REUSE command, exec'ing into a pooled container when available.
+
+    Args:
+        container_engine: The container engine command to use (e.g., 'docker').
+        container_id: Pooled REUSE container, or None to use a one-off container.
+        *args: Arguments passed to the ``reuse`` tool.
+
+    Returns:
+        The command line to execute.
+    """
+    if container_id:
+        return [container_engine, "exec", "-w", DATA_PATH, container_id, "reuse", *args]
+    return [
+        container_engine,
+        "run",
+        "--rm",
+        "--volume",
+        f"{PROJECT_ROOT}:{DATA_PATH}",
+        REUSE_IMAGE,
+        *args,
+    ]
+
+
 # Result Tracking
 def store_exit_code(
     exit_code: int, check_name: str, fail_msg: str, success_msg: str
@@ -147,42 +500,81 @@ def store_exit_code(
         fail_msg: Message to display on failure.
         success_msg: Message to display on success.
     """
+    # Parallel checks record results locally; they are committed in order later
+    exit_codes: List[int] = getattr(CHECK_STATE, "exit_codes", EXIT_CODES)
+    summary_table: List[CheckResult] = getattr(
+        CHECK_STATE, "summary_table", SUMMARY_TABLE
+    )
+
     if exit_code != EXIT_SUCCESS:
-        EXIT_CODES.append(exit_code)
-        SUMMARY_TABLE.append((check_name, "FAIL", fail_msg))
+        exit_codes.append(exit_code)
+        summary_table.append(CheckResult(check_name, "FAIL", fail_msg))
         print(f"\n{RED}{MISSING} {fail_msg}{NC}")
     else:
-        SUMMARY_TABLE.append((check_name, "PASS", success_msg))
+        summary_table.append(CheckResult(check_name, "PASS", success_msg))
         print(f"\n{GREEN}{CHECKMARK} {success_msg}{NC}")
 
 
+def store_skipped(check_name: str, msg: str) -> None:
+    """Record a check that did not run and display why.
+
+    Args:
+        check_name: Name of the check for summary table.
+        msg: Reason the check was skipped.
+    """
+    summary_table: List[CheckResult] = getattr(
+        CHECK_STATE, "summary_table", SUMMARY_TABLE
+    )
+    summary_table.append(CheckResult(check_name, "SKIP", msg))
+    print(f"\n{YELLOW}{msg}{NC}")
+
+
 # Check Functions
 def lint(container_engine: str) -> None:
     """Execute MegaLinter code quality checks.
 
     Runs MegaLinter in a Docker container to perform comprehensive code linting
-    across multiple languages and tools.
+    across multiple languages and tools. Only files changed since the default
+    branch are linted; without such changes (e.g. on the default branch), or
+    with VALIDATE_ALL_CODEBASE=true, everything is linted.
 
     Args:
         container_engine: The container engine command to use (e.g., 'docker').
     """
     print_header("Linter Health (MegaLinter)")
 
-    project_root: str = str(Path(__file__).parent.parent)
-
     cmd: List[str] = [
         container_engine,
         "run",
         "--rm",
         "--volume",
-        f"{project_root}:/tmp/lint",
+        f"{PROJECT_ROOT}:/tmp/lint",
         "-e",
         "DEFAULT_WORKSPACE=/tmp/lint",
-        MEGALINTER_IMAGE,
     ]
 
+    # Lint only what changed since the base branch, unless asked to lint all
+    files: Optional[List[str]] = (
+        None
+        if os.environ.get("VALIDATE_ALL_CODEBASE", "").lower() == "true"
+        else changed_files(DEFAULT_BRANCH)
+    )
+    files_to_lint: str = ",".join(files or [])
+    if files is not None and not files:
+        print(f"{YELLOW}No changed files compared to: {DEFAULT_BRANCH}{NC}")
+        print(f"{BLUE}Linting the whole codebase{NC}")
+    if files and len(files_to_lint) <= MAX_FILES_TO_LINT_LENGTH:
+        print(f"{BLUE}Linting {len(files)} file(s) changed from {DEFAULT_BRANCH}{NC}")
+        cmd += [
+            "-e",
+            "VALIDATE_ALL_CODEBASE=false",
+            "-e",
+            f"MEGALINTER_FILES_TO_LINT={files_to_lint}",
+        ]
+    cmd.append(MEGALINTER_IMAGE)
+
     try:
-        result: subprocess.CompletedProcess[Any] = subprocess.run(cmd, check=False)
+        result: subprocess.CompletedProcess[Any] = run_tool(cmd, check=False)
         exit_code: int = result.returncode
     except subprocess.SubprocessError as e:
         print(f"{RED}Error running MegaLinter: {e}{NC}")
@@ -204,53 +596,69 @@ def license(container_engine: str) -> None:
     """Verify license compliance using REUSE tool.
 
     Downloads missing licenses and checks that all files have proper SPDX
-    license headers and comply with REUSE specification 3.0.
+    license headers and comply with REUSE specification 3.0. Skipped on
+    feature branches with no changes since the default branch; the default
+    branch itself is always checked.
 
     Args:
         container_engine: The container engine command to use (e.g., 'docker').
     """
     print_header("License Compliance (REUSE)")
 
-    project_root: str = str(Path(__file__).parent.parent)
+    # Nothing new to check on a branch without changes from the base branch
+    if is_feature_branch() and not has_changes(DEFAULT_BRANCH):
+        print(f"{YELLOW}No changes compared to: {DEFAULT_BRANCH}{NC}")
+        store_skipped("License", "License check skipped, no changed files.")
+        print()
+        return
 
-    # Step 1: Download missing licenses
-    print(f"{BLUE}Downloading missing licenses...{NC}")
-    download_cmd: List[str] = [
-        container_engine,
-        "run",
-        "--rm",
-        "--volume",
-        f"{project_root}:{DATA_PATH}",
-        REUSE_IMAGE,
-        "download",
-        "--all",
-    ]
+    # Skip the download if the declared licenses match the last successful one
+    # and none of their texts has been removed since
+    declarations: Optional[Set[bytes]] = spdx_declarations()
+    fingerprint: Optional[str] = (
+        spdx_fingerprint(declarations) if declarations is not None else None
+    )
+    download_needed: bool = (
+        declarations is None
+        or fingerprint != read_cached_fingerprint()
+        or not license_files_present(declarations)
+    )
 
-    try:
-        download_result: subprocess.CompletedProcess[Any] = subprocess.run(
-            download_cmd, check=False
+    # Both steps share one REUSE container
+    container_id: Optional[str] = (
+        pooled_container(container_engine, REUSE_IMAGE, f"{PROJECT_ROOT}:{DATA_PATH}")
+        if download_needed
+        else None
+    )
+
+    # Step 1: Download missing licenses
+    if download_needed:
+        print(f"{BLUE}Downloading missing licenses...{NC}")
+        download_cmd: List[str] = reuse_command(
+            container_engine, container_id, "download", "--all"
         )
-        if download_result.returncode != EXIT_SUCCESS:
-            print(f"{YELLOW}Warning: License download completed with issues.{NC}")
-    except subprocess.SubprocessError as e:
-        print(f"{YELLOW}Warning: Error downloading licenses: {e}{NC}")
-    except Exception as e:
-        print(f"{YELLOW}Warning: Unexpected error during license download: {e}{NC}")
+
+        try:
+            download_result: subprocess.CompletedProcess[Any] = run_tool(
+                download_cmd, check=False
+            )
+            if download_result.returncode != EXIT_SUCCESS:
+                print(f"{YELLOW}Warning: License download completed with issues.{NC}")
+            elif fingerprint is not None:
+                write_cached_fingerprint(fingerprint)
+        except subprocess.SubprocessError as e:
+            print(f"{YELLOW}Warning: Error downloading licenses: {e}{NC}")
+        except Exception as e:
+            print(f"{YELLOW}Warning: Unexpected error during license download: {e}{NC}")
+    else:
+        print(f"{BLUE}License declarations unchanged, skipping download.{NC}")
 
     # Step 2: Lint licenses
     print(f"\n{BLUE}Linting license compliance...{NC}")
-    lint_cmd: List[str] = [
-        container_engine,
-        "run",
-        "--rm",
-        "--volume",
-        f"{project_root}:{DATA_PATH}",
-        REUSE_IMAGE,
-        "lint",
-    ]
+    lint_cmd: List[str] = reuse_command(container_engine, container_id, "lint")
 
     try:
-        result: subprocess.CompletedProcess[Any] = subprocess.run(lint_cmd, check=False)
+        result: subprocess.CompletedProcess[Any] = run_tool(lint_cmd, check=False)
         exit_code: int = result.returncode
     except subprocess.SubprocessError as e:
         print(f"{RED}Error running REUSE lint: {e}{NC}")
@@ -279,29 +687,22 @@ def commit(container_engine: str) -> None:
     """
     print_header("Commit Validation (Conform)")
 
-    project_root: Path = Path(__file__).parent.parent
     compare_to_branch: str = DEFAULT_BRANCH
 
-    # Get current branch name
+    # Count new commits compared to base branch
     try:
         result: subprocess.CompletedProcess[str] = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=project_root,
+            ["git", "rev-list", "--count", f"{compare_to_branch}.."],
+            cwd=PROJECT_ROOT,
             capture_output=True,
             text=True,
             check=False,
         )
-        current_branch: str = result.stdout.strip()
-    except subprocess.SubprocessError as e:
-        print(f"{RED}Error getting current branch: {e}{NC}")
-        store_exit_code(
-            EXIT_FAILURE,
-            "Commit",
-            "Failed to get current branch.",
-            "Commit check failed.",
+        commit_count: int = (
+            int(result.stdout.strip()) if result.returncode == EXIT_SUCCESS else 0
         )
-        print()
-        return
+    except (ValueError, subprocess.SubprocessError):
+        commit_count = 0
     except Exception as e:
         print(f"{RED}Unexpected error accessing git: {e}{NC}")
         store_exit_code(
@@ -313,23 +714,9 @@ def commit(container_engine: str) -> None:
         print()
         return
 
-    # Count new commits compared to base branch
-    try:
-        result = subprocess.run(
-            ["git", "rev-list", "--count", f"{compare_to_branch}.."],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        commit_count: int = (
-            int(result.stdout.strip()) if result.returncode == EXIT_SUCCESS else 0
-        )
-    except (ValueError, subprocess.SubprocessError):
-        commit_count = 0
-
-    # Skip if no new commits
+    # Skip if no new commits (the branch name is only needed for this message)
     if commit_count == 0:
+        current_branch: str = get_current_branch()
         print(
             f"{YELLOW}No commits found in current branch: {current_branch}, "
             f"compared to: {compare_to_branch}{NC}"
@@ -350,7 +737,7 @@ def commit(container_engine: str) -> None:
         "--rm",
         "-i",
         "--volume",
-        f"{project_root}:{REPO_PATH}",
+        f"{PROJECT_ROOT}:{REPO_PATH}",
         "-w",
         REPO_PATH,
         CONFORM_IMAGE,
@@ -359,7 +746,7 @@ def commit(container_engine: str) -> None:
     ]
 
     try:
-        result = subprocess.run(cmd, check=False, text=True)
+        result = run_tool(cmd, check=False, text=True)
         exit_code: int = result.returncode
     except subprocess.SubprocessError as e:
         print(f"{RED}Error running Conform: {e}{NC}")
@@ -377,6 +764,67 @@ def commit(container_engine: str) -> None:
     print()
 
 
+# Parallel Execution
+def run_buffered(
+    check: Callable[[str], None], container_engine: str
+) -> Tuple[str, List[int], List[CheckResult]]:
+    """Run one check with its output and results held in thread-local storage.
+
+    Args:
+        check: The check function to run.
+        container_engine: The container engine command to use (e.g., 'docker').
+
+    Returns:
+        Tuple of (captured output, exit codes, summary rows).
+    """
+    CHECK_STATE.buffer = io.StringIO()
+    CHECK_STATE.exit_codes = []
+    CHECK_STATE.summary_table = []
+    try:
+        check(container_engine)
+        return (
+            CHECK_STATE.buffer.getvalue(),
+            CHECK_STATE.exit_codes,
+            CHECK_STATE.summary_table,
+        )
+    finally:
+        del CHECK_STATE.buffer, CHECK_STATE.exit_codes, CHECK_STATE.summary_table
+
+
+def run_parallel(checks: List[Callable[[str], None]], container_engine: str) -> None:
+    """Run independent checks concurrently.
+
+    The checks mostly wait on containers, so running them side by side makes
+    the total time that of the slowest check. Each check's output is buffered
+    and replayed in the given order, and results are recorded in that order
+    once all checks have finished.
+
+    Args:
+        checks: Check functions to run.
+        container_engine: The container engine command to use (e.g., 'docker').
+    """
+    stdout: TextIO = sys.stdout
+    sys.stdout = ThreadRoutedStdout(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [
+                executor.submit(run_buffered, check, container_engine)
+                for check in checks
+            ]
+            results = []
+            for future in futures:
+                output, exit_codes, summary_table = future.result()
+                stdout.write(output)
+                stdout.flush()
+                results.append((exit_codes, summary_table))
+    finally:
+        sys.stdout = stdout
+
+    for exit_codes, summary_table in results:
+        EXIT_CODES.extend(exit_codes)
+        SUMMARY_TABLE.extend(summary_table)
+
+
 # Summary and Reporting
 def check_exit_codes() -> int:
     """Display summary table and determine overall exit code.
@@ -387,75 +835,68 @@ def check_exit_codes() -> int:
     Returns:
         EXIT_SUCCESS (0) if all checks passed, EXIT_FAILURE (1) otherwise.
     """
-    print_banner("CODE QUALITY & COMPLIANCE RUN SUMMARY")
-
-    # Define table column widths
-    check_width: int = 18
-    status_width: int = 13
-    message_width: int = 50
-
-    # Table header
-    print(
-        f"\n{BOLD}{BLUE}| {'Check':<{check_width}} | "
-        f"{'Status':<{status_width}} | {'Message':<{message_width}} |{NC}"
-    )
-    print(
-        f"{BLUE}|{'-' * (check_width + 2)}|{'-' * (status_width + 2)}|"
-        f"{'-' * (message_width + 2)}|{NC}"
-    )
-
-    # Table rows
-    for check, status, msg in SUMMARY_TABLE:
-        if status == "PASS":
-            status_symbol: str = f"PASS {CHECKMARK}"
-            status_color: str = GREEN
-        else:
-            status_symbol = f"FAIL {MISSING}"
-            status_color = RED
+    # The whole summary is assembled first and written in one call
+    lines: List[str] = [format_banner("CODE QUALITY & COMPLIANCE RUN SUMMARY")]
+    if SUMMARY_TABLE:
+        lines += ["", TABLE_HEADER, TABLE_BORDER]
 
+    for result in SUMMARY_TABLE:
         # Truncate message if too long
+        msg: str = result.message
         msg_disp: str = (
-            msg if len(msg) <= message_width else f"{msg[:message_width - 3]}..."
-        )
-
-        # Format row with proper spacing (without ANSI codes in width calculation)
-        row: str = (
-            f"| {check:<{check_width}} | "
-            f"{status_symbol:<{status_width}} | "
-            f"{msg_disp:<{message_width}} |"
+            msg if len(msg) <= MESSAGE_WIDTH else f"{msg[:MESSAGE_WIDTH - 3]}..."
         )
-        # Apply colors to status part
-        row_colored: str = row.replace(
-            status_symbol, f"{status_color}{status_symbol}{NC}"
+        lines.append(
+            f"| {result.check:<{CHECK_WIDTH}} | {STATUS_CELLS[result.status]} | "
+            f"{msg_disp:<{MESSAGE_WIDTH}} |"
         )
-        print(row_colored)
 
-    print()
+    lines.append("")
 
     # Determine final result
     if EXIT_CODES:
-        print_banner(f"{RED}Some checks failed. See above for details.{NC}")
-        return EXIT_FAILURE
+        lines.append(
+            format_banner(f"{RED}Some checks failed. See above for details.{NC}")
+        )
+        exit_code: int = EXIT_FAILURE
     else:
-        print_banner(f"{GREEN}All checks passed!{NC}")
-        return EXIT_SUCCESS
+        lines.append(format_banner(f"{GREEN}All checks passed!{NC}"))
+        exit_code = EXIT_SUCCESS
 
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return exit_code
 
-# Main Entry Point
-def main() -> int:
-    """Execute compliance checks based on command-line arguments.
 
-    This is the main entry point that orchestrates compliance checks:
-    1. Parses command-line arguments
-    2. Detects and verifies Docker availability
-    3. Runs requested check(s)
-    4. Displays summary and returns exit code
+# Argument Parsing
+class Options(NamedTuple):
+    """Parsed command-line options."""
+
+    check: str
+    skip_pull: bool
+
+
+def parse_args(argv: List[str]) -> Options:
+    """Parse command-line arguments.
+
+    Plain invocations (at most one check name plus ``--skip-pull``) are
+    recognized directly. Anything else, including ``--help`` and invalid
+    input, goes through argparse, which is only imported in that case.
+
+    Args:
+        argv: Command-line arguments without the program name.
 
     Returns:
-        EXIT_SUCCESS (0) if all checks pass, EXIT_FAILURE (1) otherwise,
-        or EXIT_ERROR (2) for system/configuration errors.
+        The parsed options.
     """
-    # Parse command-line arguments
+    names: List[str] = [arg for arg in argv if arg != "--skip-pull"]
+    if (
+        len(names) <= 1
+        and all(name in CHECK_NAMES for name in names)
+        and argv.count("--skip-pull") <= 1
+    ):
+        return Options(names[0] if names else "all", "--skip-pull" in argv)
+
     parser = argparse.ArgumentParser(
         description="Code Quality & Compliance Check Script",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -470,17 +911,42 @@ Examples:
   python compliance.py lint
   python compliance.py license
   python compliance.py all
+  python compliance.py all --skip-pull
         """,
     )
     parser.add_argument(
         "check",
         nargs="?",
         default="all",
-        choices=["lint", "license", "conform", "all"],
+        choices=CHECK_NAMES,
         help="Specific check to run (default: all)",
     )
+    parser.add_argument(
+        "--skip-pull",
+        action="store_true",
+        help="Do not pull images up front (use local images, e.g. offline)",
+    )
+
+    args = parser.parse_args(argv)
+    return Options(args.check, args.skip_pull)
+
+
+# Main Entry Point
+def main() -> int:
+    """Execute compliance checks based on command-line arguments.
 
-    args = parser.parse_args()
+    This is the main entry point that orchestrates compliance checks:
+    1. Parses command-line arguments
+    2. Detects and verifies Docker availability
+    3. Runs requested check(s)
+    4. Displays summary and returns exit code
+
+    Returns:
+        EXIT_SUCCESS (0) if all checks pass, EXIT_FAILURE (1) otherwise,
+        or EXIT_ERROR (2) for system/configuration errors.
+    """
+    # Parse command-line arguments
+    args: Options = parse_args(sys.argv[1:])
 
     # Detect and verify container engine
     container_engine: str = detect_container_engine()
@@ -492,15 +958,22 @@ Examples:
         "conform": commit,
     }
 
+    # Fetch all required images in parallel before the checks need them
+    if not args.skip_pull:
+        checks: List[str] = list(CHECK_IMAGES) if args.check == "all" else [args.check]
+        images: List[str] = [image for check in checks for image in CHECK_IMAGES[check]]
+        pull_images(container_engine, images)
+
     # Execute requested check(s)
     if args.check == "all":
         # Running all checks - show banner and summary
         print_banner("Starting Code Quality & Compliance Checks")
         print(f"{GREEN}{CHECKMARK} Using container engine: {container_engine}{NC}")
 
+        # MegaLinter applies fixes to the shared tree, so it runs on its own
+        # with live output; the REUSE and Conform checks then run side by side
         lint(container_engine)
-        license(container_engine)
-        commit(container_engine)
+        run_parallel([license, commit], container_engine)
 
         # Display summary table
         return check_exit_codes()
@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 Broadsage <opensource@broadsage.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Container, Pool & Cache Helpers for compliance.py.
+
+State kept between runs lives in CACHE_DIR under the project root:
+- a stamp recording a recent successful Docker check
+- the SPDX fingerprint of the last successful REUSE license download
+
+Containers started for the REUSE checks are pooled for the lifetime of the
+process and removed when it exits.
+"""
+
+import atexit
+import hashlib
+import re
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, Final, FrozenSet, Optional, Set, Tuple
+
+# Project root (repository checked by all tools), resolved once at import
+PROJECT_ROOT: Final[str] = str(Path(__file__).resolve().parent.parent)
+
+# Cache of state from previous runs, relative to the project root
+CACHE_DIR: Final[str] = ".compliance-cache"
+REUSE_SPDX_HASH_FILE: Final[str] = "reuse-spdx.sha256"
+DOCKER_VERIFIED_FILE: Final[str] = "docker-verified"
+
+# A successful Docker check is reused by later runs for this long (seconds)
+DOCKER_VERIFIED_TTL: Final[int] = 300
+
+# SPDX declaration (file headers, or "SPDX-License-Identifier = ..." in
+# REUSE.toml) whose value is a plain license expression; unrendered
+# template placeholders do not match
+SPDX_DECLARATION_RE: Final["re.Pattern[str]"] = re.compile(
+    r'SPDX-License-Identifier\s*[:=]\s*"?([\w.+\-() ]+?)"?\s*(?:-->|\*/)?\s*$'
+)
+# Operators within a license expression, as opposed to license identifiers
+SPDX_OPERATORS: Final[FrozenSet[str]] = frozenset({"AND", "OR", "WITH"})
+
+# Pooled containers: (image, volume) -> container ID
+CONTAINERS: Dict[Tuple[str, str], str] = {}
+
+
+# Docker Check Stamp
+def docker_recently_verified() -> bool:
+    """Tell whether a run within DOCKER_VERIFIED_TTL seconds verified Docker."""
+    try:
+        stamp: Path = Path(PROJECT_ROOT, CACHE_DIR, DOCKER_VERIFIED_FILE)
+        return time.time() - stamp.stat().st_mtime < DOCKER_VERIFIED_TTL
+    except OSError:
+        return False
+
+
+def mark_docker_verified() -> None:
+    """Record a successful Docker check for later runs."""
+    try:
+        cache_dir = Path(PROJECT_ROOT, CACHE_DIR)
+        cache_dir.mkdir(exist_ok=True)
+        (cache_dir / DOCKER_VERIFIED_FILE).touch()
+    except OSError:
+        pass
+
+
+# REUSE Download Cache
+def spdx_declarations() -> Optional[Set[bytes]]:
+    """Collect the SPDX license declarations in the project.
+
+    Uses ``git grep`` over tracked and untracked (non-ignored) files, which
+    covers file headers, ``.license`` sidecars and REUSE.toml alike.
+
+    Returns:
+        The de-duplicated declaration lines, or None if git is unavailable
+        or this is not a git repository.
+    """
+    try:
+        result: subprocess.CompletedProcess[bytes] = subprocess.run(
+            ["git", "grep", "-h", "-I", "--untracked", "-F", "SPDX-License-Identifier"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    # git grep exits 1 when nothing matches
+    if result.returncode not in (0, 1):
+        return None
+
+    return {line.strip() for line in result.stdout.splitlines()}
+
+
+def spdx_fingerprint(declarations: Set[bytes]) -> str:
+    """Hash a set of SPDX declarations.
+
+    Args:
+        declarations: Declaration lines from spdx_declarations().
+
+    Returns:
+        Hex SHA-256 of the sorted declaration lines.
+    """
+    return hashlib.sha256(b"\n".join(sorted(declarations))).hexdigest()
+
+
+def license_files_present(declarations: Set[bytes]) -> bool:
+    """Tell whether every declared license has its text under LICENSES/.
+
+    Custom ``LicenseRef-`` licenses are left out, as REUSE cannot download
+    them.
+
+    Args:
+        declarations: Declaration lines from spdx_declarations().
+
+    Returns:
+        True if no downloadable license text is missing.
+    """
+    license_ids: Set[str] = set()
+    for line in declarations:
+        match = SPDX_DECLARATION_RE.search(line.decode("utf-8", errors="replace"))
+        if match:
+            license_ids.update(re.findall(r"[\w.+\-]+", match.group(1)))
+
+    licenses_dir = Path(PROJECT_ROOT, "LICENSES")
+    return all(
+        (licenses_dir / f"{license_id}.txt").is_file()
+        for license_id in license_ids
+        if license_id.upper() not in SPDX_OPERATORS
+        and not license_id.startswith("LicenseRef-")
+    )
+
+
+def read_cached_fingerprint() -> Optional[str]:
+    """Return the SPDX fingerprint recorded by the last successful download."""
+    try:
+        return (
+            Path(PROJECT_ROOT, CACHE_DIR, REUSE_SPDX_HASH_FILE)
+            .read_text(encoding="utf-8")
+            .strip()
+        )
+    except OSError:
+        return None
+
+
+def write_cached_fingerprint(fingerprint: str) -> None:
+    """Record the SPDX fingerprint after a successful license download."""
+    try:
+        cache_dir = Path(PROJECT_ROOT, CACHE_DIR)
+        cache_dir.mkdir(exist_ok=True)
+        (cache_dir / REUSE_SPDX_HASH_FILE).write_text(
+            fingerprint + "\n", encoding="utf-8"
+        )
+    except OSError:
+        pass
+
+
+# Container Pool
+def remove_containers(container_engine: str) -> None:
+    """Force-remove all pooled containers.
+
+    Args:
+        container_engine: The container engine command to use (e.g., 'docker').
+    """
+    if not CONTAINERS:
+        return
+    subprocess.run(
+        [container_engine, "rm", "-f", *CONTAINERS.values()],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    CONTAINERS.clear()
+
+
+def pooled_container(container_engine: str, image: str, volume: str) -> Optional[str]:
+    """Start an idle, long-lived container that commands can be exec'd into.
+
+    Images used for several commands in a row are started once and reused via
+    ``exec`` instead of paying container startup for every ``run --rm``. The
+    container is removed when the script exits.
+
+    Args:
+        container_engine: The container engine command to use (e.g., 'docker').
+        image: Image to start.
+        volume: Volume mount specification (``host:container``).
+
+    Returns:
+        The container ID, or None if the container could not be started.
+    """
+    key: Tuple[str, str] = (image, volume)
+    if key in CONTAINERS:
+        return CONTAINERS[key]
+
+    try:
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            [
+                container_engine,
+                "run",
+                "-d",
+                "--rm",
+                "--volume",
+                volume,
+                "--entrypoint",
+                "sh",
+                image,
+                "-c",
+                "tail -f /dev/null",
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+
+    if not CONTAINERS:
+        atexit.register(remove_containers, container_engine)
+    CONTAINERS[key] = result.stdout.strip()
+    return CONTAINERS[key]
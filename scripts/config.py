@@ -18,10 +18,11 @@ Architecture:
     Each layer has a single responsibility and can be tested independently.
 """
 
+import argparse
+import json
+import os
 import sys
-import copy
-from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, FrozenSet, List, NamedTuple, Optional, Tuple
 
 try:
     import yaml
@@ -30,11 +31,107 @@ except ImportError:
     print("   Install with: pip install pyyaml")
     sys.exit(1)
 
+# Prefer the libyaml C bindings; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper  # type: ignore
+
+# Sections always taken from defaults; every other section is a feature bundle
+CORE_SECTIONS: FrozenSet[str] = frozenset(
+    {
+        "organization",
+        "metadata",
+        "build",
+        "image",
+        "documentation",
+        "template",
+    }
+)
+
+# Target platforms accepted in build.platforms
+VALID_PLATFORMS: FrozenSet[str] = frozenset(
+    {
+        "linux/amd64",
+        "linux/arm64",
+        "linux/arm/v7",
+        "linux/arm/v6",
+        "linux/386",
+        "linux/ppc64le",
+        "linux/s390x",
+    }
+)
+_VALID_PLATFORMS_STR = ", ".join(sorted(VALID_PLATFORMS))
+
+
+def _invalid_platforms(platforms: List[Any]) -> List[str]:
+    """Return an error for every entry of build.platforms that is not valid."""
+    return [
+        f"Invalid platform: {platform}. Valid: {_VALID_PLATFORMS_STR}"
+        for platform in platforms
+        if not isinstance(platform, str) or platform not in VALID_PLATFORMS
+    ]
+
+
+class FieldRule(NamedTuple):
+    """Validation rule for one ``section.key`` field of the merged config.
+
+    A field must hold a non-empty value of ``expected`` type. A missing section
+    or key is only an error when the matching message is set; ``check_items``
+    adds further checks once the value itself is valid.
+    """
+
+    section: str
+    key: str
+    expected: type
+    invalid_error: str
+    missing_section_error: Optional[str] = None
+    missing_key_error: Optional[str] = None
+    check_items: Optional[Callable[[Any], List[str]]] = None
+
+
+# Validation schema, applied in order by validate_config
+VALIDATION_SCHEMA: Tuple[FieldRule, ...] = (
+    FieldRule(
+        "image",
+        "name",
+        str,
+        "image.name must be a non-empty string",
+        missing_key_error="image.name must be a non-empty string",
+    ),
+    FieldRule(
+        "metadata",
+        "license",
+        str,
+        "metadata.license must be a non-empty string",
+        missing_section_error="metadata section is required with license field",
+        missing_key_error="metadata.license must be a non-empty string",
+    ),
+    FieldRule(
+        "build",
+        "platforms",
+        list,
+        "build.platforms must be a non-empty list",
+        check_items=_invalid_platforms,
+    ),
+)
+
+# Marks a key absent from its section (None is a present, invalid value)
+_MISSING = object()
+
+# Configuration file paths
+DEFAULTS_FILE = "vars/defaults.yaml"
+PROJECT_FILE = "/tmp/project.yaml"
+OUTPUT_FILE = "/tmp/merged_config.yaml"
+
 
 # CORE LOGIC LAYER - Pure functions for business logic
 def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """Deep merge two dictionaries.
 
+    Neither input is mutated. Only dicts along overridden paths are rebuilt;
+    untouched subtrees are shared with the inputs rather than copied.
+
     Args:
         base: Base dictionary (defaults)
         override: Override dictionary (project-specific)
@@ -42,15 +139,44 @@ def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]
     Returns:
         Merged dictionary where override values win on conflicts
     """
-    result = copy.deepcopy(base)
+    result = dict(base)
+    _merge_into(result, override)
+    return result
+
+
+def _merge_into(target: Dict[str, Any], override: Dict[str, Any]) -> None:
+    """Deep merge override into target in place.
 
+    Only target itself is mutated. Nested dicts on overridden paths are
+    shallow-copied before being merged into, so subtrees shared with other
+    structures (such as YAML aliases) are never modified through target.
+
+    Args:
+        target: Dictionary owned by the caller, updated in place
+        override: Override dictionary whose values win on conflicts
+    """
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)  # type: ignore
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            target[key] = child = dict(current)  # type: ignore
+            _merge_into(child, value)  # type: ignore
         else:
-            result[key] = copy.deepcopy(value)
+            target[key] = value
 
-    return result
+
+def _clone(value: Any) -> Any:
+    """Copy a parsed config tree.
+
+    Config trees only nest dicts and lists around immutable scalars, so those
+    two containers are rebuilt and every other value is shared. This avoids
+    copy.deepcopy's memo bookkeeping and per-object dispatch.
+    """
+    kind = type(value)
+    if kind is dict:
+        return {k: _clone(v) for k, v in value.items()}
+    if kind is list:
+        return [_clone(v) for v in value]
+    return value
 
 
 def get_feature_bundles(defaults: Dict[str, Any]) -> List[str]:
@@ -65,11 +191,7 @@ def get_feature_bundles(defaults: Dict[str, Any]) -> List[str]:
     Returns:
         List of feature bundle names (e.g., ['github', 'security', 'registry'])
     """
-    core_sections = {"organization", "metadata", "build", "image", "documentation"}
-    features = [
-        key for key in defaults.keys() if key not in core_sections
-    ]  # type: ignore
-    return sorted(features)
+    return sorted(defaults.keys() - CORE_SECTIONS)
 
 
 def make_safe_default(value: Any) -> Any:
@@ -99,11 +221,11 @@ def activate_feature_bundles(
 ) -> Dict[str, Any]:
     """Merge configs and activate feature bundles based on feature flags.
 
-    Logic:
+    Logic (one pass over defaults, overrides applied as each section is built):
         1. Always include core sections (organization, metadata, etc.)
         2. For enabled features: load bundle from defaults
-        3. Apply project-specific overrides
-        4. For disabled features: use safe defaults (prevent undefined vars in Ansible)
+        3. For disabled features: use safe defaults (prevent undefined vars in Ansible)
+        4. Apply project-specific overrides
 
     Args:
         defaults: Configuration with feature bundles
@@ -113,34 +235,28 @@ def activate_feature_bundles(
         Merged configuration with all features (enabled or safe defaults)
     """
     merged: Dict[str, Any] = {}
-    core_sections = {
-        "organization",
-        "metadata",
-        "build",
-        "image",
-        "documentation",
-        "template",
-    }
     features = project.get("features", {})
-    bundles = get_feature_bundles(defaults)
-
-    # Always include core sections from defaults
-    for section in core_sections:
-        if section in defaults:
-            merged[section] = copy.deepcopy(defaults[section])
-
-    # Activate enabled bundles from defaults
-    for bundle in bundles:
-        enabled = features.get(bundle, False)
-        if enabled and bundle in defaults:
-            merged[bundle] = copy.deepcopy(defaults[bundle])  # type: ignore
+
+    # Single pass: each section is built once, then overridden from project
+    for section, value in defaults.items():
+        if section in CORE_SECTIONS or features.get(section, False):
+            # Core sections and enabled bundles come from defaults
+            result = _clone(value)
         else:
             # Create safe defaults for disabled features
-            if bundle in defaults:
-                merged[bundle] = make_safe_default(defaults[bundle])
+            result = make_safe_default(value)
 
-    # Apply project-specific overrides (merge all sections from project)
-    merged = deep_merge(merged, project)
+        override = project.get(section, _MISSING)
+        if isinstance(result, dict) and isinstance(override, dict):
+            _merge_into(result, override)
+        elif override is not _MISSING:
+            result = override
+        merged[section] = result
+
+    # Sections only the project defines (such as features) are taken as-is
+    for section, value in project.items():
+        if section not in defaults:
+            merged[section] = value
 
     return merged
 
@@ -156,65 +272,84 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
     """
     errors: List[str] = []
 
-    # Validate image name if image section exists
-    if "image" in config:
-        image_name = config["image"].get("name")
-        if not image_name or not isinstance(image_name, str):
-            errors.append("image.name must be a non-empty string")
-
-    # Validate metadata.license (MANDATORY)
-    if "metadata" in config:
-        license_value = config["metadata"].get("license")
-        if not license_value or not isinstance(license_value, str):
-            errors.append("metadata.license must be a non-empty string")
-    else:
-        errors.append("metadata section is required with license field")
-
-    # Validate build.platforms if present
-    if "build" in config and "platforms" in config["build"]:
-        platforms = config["build"]["platforms"]
-        if not isinstance(platforms, list) or not platforms:
-            errors.append("build.platforms must be a non-empty list")
+    for rule in VALIDATION_SCHEMA:
+        values = config.get(rule.section)
+        if values is None:
+            if rule.missing_section_error:
+                errors.append(rule.missing_section_error)
+            continue
+
+        value = values.get(rule.key, _MISSING) if isinstance(values, dict) else _MISSING
+        if value is _MISSING:
+            if rule.missing_key_error:
+                errors.append(rule.missing_key_error)
+        elif not value or not isinstance(value, rule.expected):
+            errors.append(rule.invalid_error)
+        elif rule.check_items:
+            errors.extend(rule.check_items(value))
 
     return errors
 
 
 # I/O LAYER - File loading and saving
-def _handle_io_error(operation: str, file_path: Path, error: Exception) -> None:
+def _handle_io_error(operation: str, file_path: str, error: Exception) -> None:
     """Handle I/O errors consistently (DRY)."""
     icon = "❌"
     print(f"{icon} Error {operation} {file_path}: {error}")
     sys.exit(1)
 
 
-def load_yaml(file_path: Path) -> Dict[str, Any]:
+def _intern_tree(value: Any) -> Any:
+    """Intern every string key and value in a parsed YAML tree.
+
+    Config files repeat the same keys and leaves ('enabled', 'linux/amd64'),
+    so interning lets both documents share one object per distinct string.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {
+            (sys.intern(k) if isinstance(k, str) else k): _intern_tree(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_tree(v) for v in value]
+    return value
+
+
+def load_yaml(file_path: str) -> Dict[str, Any]:
     """Load and parse a YAML file.
 
     Args:
         file_path: Path to YAML file
 
     Returns:
-        Parsed YAML as dictionary, empty dict if file doesn't exist
+        Parsed YAML as dictionary (strings interned), empty dict if file
+        doesn't exist
 
     Raises:
         SystemExit: If file parsing fails
     """
-    if not file_path.exists():
+    if not os.path.isfile(file_path):
         return {}
 
     try:
         with open(file_path, encoding="utf-8") as f:
-            content = yaml.safe_load(f)
-            data: Dict[str, Any] = content if content else {}
+            # _Loader is CSafeLoader, or SafeLoader without libyaml
+            content = yaml.load(f.read(), Loader=_Loader)  # nosec B506
+        data: Dict[str, Any] = _intern_tree(content) if content else {}
         return data
     except yaml.YAMLError as e:
         _handle_io_error("parsing", file_path, e)
         return {}  # Never reached, but satisfies type checker
 
 
-def save_yaml(file_path: Path, data: Dict[str, Any]) -> None:
+def save_yaml(file_path: str, data: Dict[str, Any]) -> None:
     """Save data to a YAML file.
 
+    The document is serialized in memory first and written with a single
+    write() rather than the many small writes the emitter makes to a stream.
+
     Args:
         file_path: Path where to save YAML file
         data: Dictionary to save
@@ -223,35 +358,87 @@ def save_yaml(file_path: Path, data: Dict[str, Any]) -> None:
         SystemExit: If file write fails
     """
     try:
+        text = yaml.dump(
+            data,
+            Dumper=_Dumper,
+            default_flow_style=False,
+            sort_keys=False,
+            indent=2,
+            allow_unicode=True,
+        )
         with open(file_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, indent=2)
+            f.write(text)
+    except Exception as e:
+        _handle_io_error("writing", file_path, e)
+
+
+def save_json(file_path: str, data: Dict[str, Any]) -> None:
+    """Save data as JSON, which YAML consumers such as Ansible read natively.
+
+    Args:
+        file_path: Path where to save the file
+        data: Dictionary to save
+
+    Raises:
+        SystemExit: If file write fails
+    """
+    try:
+        with open(file_path, "w", encoding="utf-8") as f:
+            # default=str covers YAML-only scalars such as dates
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            f.write("\n")
     except Exception as e:
         _handle_io_error("writing", file_path, e)
 
 
 # CLI LAYER - User interface and main entry point
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Merge defaults.yaml and project.yaml with feature activation"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "yaml"],
+        default="json",
+        help="Output format of the merged config (default: json, valid YAML 1.2)",
+    )
+    return parser.parse_args(argv)
+
+
+def format_header(title: str) -> str:
+    """Format a header block."""
+    line = "=" * 70
+    return f"{line}\n{title}\n{line}"
+
+
+def format_status(message: str, success: bool = True) -> str:
+    """Format a status message with icon."""
+    prefix = "✓" if success else "❌"
+    return f"{prefix} {message}"
+
+
 def print_header(title: str) -> None:
     """Print a formatted header."""
-    line = "=" * 70
-    print(f"{line}\n{title}\n{line}")
+    print(format_header(title))
 
 
 def print_status(message: str, success: bool = True) -> None:
     """Print a status message with icon."""
-    prefix = "✓" if success else "❌"
-    print(f"{prefix} {message}")
+    print(format_status(message, success))
 
 
 def print_features(config: Dict[str, Any]) -> None:
-    """Print activated features in a readable format."""
+    """Print activated features in a readable format (single write)."""
     features = config.get("features", {})
     if not features:
         return
 
-    print("\nActivated features:")
+    lines = ["", "Activated features:"]
     for name, enabled in features.items():
         status = "✓" if enabled else "○"
-        print(f"  {status} {name}: {enabled}")
+        lines.append(f"  {status} {name}: {enabled}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_validation_errors(errors: List[str]) -> None:
@@ -260,18 +447,18 @@ def print_validation_errors(errors: List[str]) -> None:
         print(f"  • {error}")
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """Main entry point - orchestrates the merge process."""
-    # Configuration file paths
-    defaults_file = Path("vars/defaults.yaml")
-    project_file = Path("/tmp/project.yaml")
-    output_file = Path("/tmp/merged_config.yaml")
+    args = parse_args(argv)
+    defaults_file = DEFAULTS_FILE
+    project_file = PROJECT_FILE
+    output_file = OUTPUT_FILE
 
     # Header
     print_header("Docker Scaffold Configuration Merger")
 
     # Validate input
-    if not project_file.exists():
+    if not os.path.isfile(project_file):
         print_status(f"Project file not found: {project_file}", success=False)
         print("   Please mount your project.yaml to /tmp/project.yaml")
         sys.exit(1)
@@ -279,7 +466,7 @@ def main() -> None:
     # Load configurations
     print("\nLoading configurations...")
     defaults = load_yaml(defaults_file)
-    if defaults_file.exists():
+    if os.path.isfile(defaults_file):
         print_status(f"Loaded defaults from {defaults_file}")
     else:
         print_status("Defaults file not found, using project config only", success=True)
@@ -309,13 +496,20 @@ def main() -> None:
 
     # Save
     print("\nGenerating output...")
-    save_yaml(output_file, merged)
-    print_status(f"Configuration saved to {output_file}")
-
-    # Summary
-    print_header(f"🎉 Configuration ready for: {image_name}")
-    print(f"\nNext: Ansible will use {output_file} to generate scaffold")
-    print(f"Note: {output_file} will be automatically cleaned up after generation")
+    if args.format == "yaml":
+        save_yaml(output_file, merged)
+    else:
+        save_json(output_file, merged)
+
+    # Summary (emitted as one block)
+    summary = [
+        format_status(f"Configuration saved to {output_file}"),
+        format_header(f"🎉 Configuration ready for: {image_name}"),
+        "",
+        f"Next: Ansible will use {output_file} to generate scaffold",
+        f"Note: {output_file} will be automatically cleaned up after generation",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ Unit tests for config.py
 
 Test Coverage:
   - Deep merge functionality with nested dicts
+  - Merge and safe-default invariants over seeded random configs
   - Feature bundle detection and activation
   - Safe default generation for disabled features
   - Configuration validation
@@ -16,6 +17,8 @@ Test Coverage:
 Run with: python3 test_config.py
 """
 
+import copy
+import random
 import unittest
 from typing import Any, Dict, List
 
@@ -58,6 +61,86 @@ class TestDeepMerge(unittest.TestCase):
         deep_merge(base, override)
         self.assertEqual(base, base_copy)
 
+    def test_nested_merge_leaves_inputs_intact(self) -> None:
+        """Test that merging nested dicts rebuilds only overridden paths."""
+        base = {"x": {"y": 1}, "keep": {"z": 2}}
+        override = {"x": {"y": 10}}
+
+        result = deep_merge(base, override)
+        self.assertEqual(result, {"x": {"y": 10}, "keep": {"z": 2}})
+        self.assertEqual(base["x"], {"y": 1})
+        self.assertIsNot(result["x"], base["x"])
+
+
+def random_config(rng: random.Random, depth: int = 0) -> Dict[str, Any]:
+    """Build a random config-shaped dict from a seeded generator."""
+    scalars: List[Any] = [True, False, 0, 7, 1.5, "", "value", None, [], [1, "a"]]
+    config_dict: Dict[str, Any] = {}
+    for _ in range(rng.randint(0, 4)):
+        key = rng.choice("abcdef")
+        if depth < 3 and rng.random() < 0.4:
+            config_dict[key] = random_config(rng, depth + 1)
+        else:
+            config_dict[key] = copy.deepcopy(rng.choice(scalars))
+    return config_dict
+
+
+class TestMergeInvariants(unittest.TestCase):
+    """Check merge invariants over seeded random configs."""
+
+    SEED = 20250101
+    CASES = 200
+
+    def setUp(self) -> None:
+        """Create a reproducible generator for each test."""
+        self.rng = random.Random(self.SEED)
+
+    def test_empty_merge_is_identity(self) -> None:
+        """Test that merging with an empty dict returns an equal dict."""
+        for case in range(self.CASES):
+            value = random_config(self.rng)
+            with self.subTest(case=case, value=value):
+                self.assertEqual(deep_merge(value, {}), value)
+                self.assertEqual(deep_merge({}, value), value)
+                self.assertEqual(deep_merge(value, value), value)
+
+    def test_override_wins_and_inputs_intact(self) -> None:
+        """Test that override values win and neither input is mutated."""
+        for case in range(self.CASES):
+            base = random_config(self.rng)
+            override = random_config(self.rng)
+            base_before = copy.deepcopy(base)
+            override_before = copy.deepcopy(override)
+            with self.subTest(case=case, base=base, override=override):
+                result = deep_merge(base, override)
+                self.assertEqual(base, base_before)
+                self.assertEqual(override, override_before)
+                self.assertEqual(set(result), set(base) | set(override))
+                for key, value in override.items():
+                    nested = isinstance(value, dict) and isinstance(base.get(key), dict)
+                    if not nested:
+                        self.assertEqual(result[key], value)
+
+    def test_safe_default_keeps_shape(self) -> None:
+        """Test that safe defaults keep dict keys and empty every list."""
+
+        def check(value: Any, safe: Any) -> None:
+            if isinstance(value, dict):
+                self.assertEqual(set(safe), set(value))
+                for key in value:
+                    check(value[key], safe[key])
+            elif isinstance(value, list):
+                self.assertEqual(safe, [])
+            elif isinstance(value, str):
+                self.assertEqual(safe, value)
+            else:
+                self.assertFalse(safe)
+
+        for case in range(self.CASES):
+            value = random_config(self.rng)
+            with self.subTest(case=case, value=value):
+                check(value, make_safe_default(value))
+
 
 class TestFeatureBundles(unittest.TestCase):
     """Test feature bundle detection."""
@@ -78,6 +161,14 @@ class TestFeatureBundles(unittest.TestCase):
         self.assertNotIn("organization", bundles)
         self.assertNotIn("build", bundles)
 
+    def test_template_is_core_section(self) -> None:
+        """Test that template settings are kept from defaults, not toggled."""
+        defaults: Dict[str, Any] = {"template": {"exclude": ["REUSE.toml"]}}
+
+        self.assertNotIn("template", get_feature_bundles(defaults))
+        result = activate_feature_bundles(defaults, {"features": {}})
+        self.assertEqual(result["template"], {"exclude": ["REUSE.toml"]})
+
 
 class TestMakeSafeDefault(unittest.TestCase):
     """Test safe default conversion."""
@@ -135,6 +226,18 @@ class TestFeatureActivation(unittest.TestCase):
         self.assertEqual(result["github"]["workflows"], True)
         self.assertEqual(result["github"]["issues"], False)
 
+    def test_override_does_not_leak_through_yaml_alias(self) -> None:
+        """Test that overriding one alias of a shared subtree leaves the other."""
+        shared = {"enabled": True}
+        defaults = {"github": {"a": shared, "b": shared}}
+        project = {"features": {"github": True}, "github": {"a": {"enabled": False}}}
+
+        result = activate_feature_bundles(defaults, project)
+
+        self.assertFalse(result["github"]["a"]["enabled"])
+        self.assertTrue(result["github"]["b"]["enabled"])
+        self.assertTrue(shared["enabled"])
+
 
 class TestValidation(unittest.TestCase):
     """Test configuration validation."""
@@ -143,6 +246,7 @@ class TestValidation(unittest.TestCase):
         """Test that valid config has no errors."""
         config: Dict[str, Any] = {
             "image": {"name": "myapp"},
+            "metadata": {"license": "Apache-2.0"},
             "build": {"platforms": ["linux/amd64"]},
         }
 
@@ -152,6 +256,7 @@ class TestValidation(unittest.TestCase):
     def test_missing_image_section(self) -> None:
         """Test that missing image section is allowed (optional)."""
         config: Dict[str, Any] = {
+            "metadata": {"license": "Apache-2.0"},
             "build": {"platforms": ["linux/amd64"]},
         }
 
@@ -159,6 +264,13 @@ class TestValidation(unittest.TestCase):
         # Image section is optional - no error expected
         self.assertEqual(errors, [])
 
+    def test_missing_metadata_section(self) -> None:
+        """Test that a missing metadata section is reported."""
+        config: Dict[str, Any] = {"image": {"name": "myapp"}}
+
+        errors = validate_config(config)
+        self.assertEqual(errors, ["metadata section is required with license field"])
+
     def test_empty_image_name(self) -> None:
         """Test that empty image name is caught if image section exists."""
         config: Dict[str, Any] = {
@@ -179,6 +291,28 @@ class TestValidation(unittest.TestCase):
         errors = validate_config(config)
         self.assertTrue(any("platforms" in e for e in errors))
 
+    def test_invalid_platform(self) -> None:
+        """Test that each unsupported platform is reported."""
+        config: Dict[str, Any] = {
+            "metadata": {"license": "Apache-2.0"},
+            "build": {"platforms": ["linux/amd64", "linux/invalid", "windows"]},
+        }
+
+        errors = validate_config(config)
+        self.assertEqual(len(errors), 2)
+        self.assertIn("Invalid platform: linux/invalid", errors[0])
+        self.assertIn("Invalid platform: windows", errors[1])
+
+    def test_non_mapping_build_section(self) -> None:
+        """Test that a build section that is not a mapping is ignored."""
+        config = {
+            "image": {"name": "test"},
+            "metadata": {"license": "Apache-2.0"},
+            "build": None,
+        }
+
+        self.assertEqual(validate_config(config), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: Copyright (c) 2025 Broadsage <opensource@broadsage.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for release.py
+
+Test Coverage:
+  - Reading the current template version from project.yaml
+  - Reading image labels from the registry API (urlopen mocked)
+
+Run with: python3 test_release.py
+"""
+
+import email.message
+import io
+import json
+import os
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List
+from unittest import mock
+
+import release
+from release import TemplateReleaseManager
+
+
+class TestCurrentVersion(unittest.TestCase):
+    """Test reading template.version from project.yaml."""
+
+    def setUp(self) -> None:
+        """Create a temporary directory for project files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.project_file = os.path.join(self.tmpdir.name, "project.yaml")
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.tmpdir.cleanup()
+
+    def current_version(self, content: str) -> str:
+        """Write content to project.yaml and read its template version."""
+        with open(self.project_file, "w", encoding="utf-8") as f:
+            f.write(content)
+        return TemplateReleaseManager(self.project_file).get_current_version()
+
+    def test_plain_and_quoted_versions(self) -> None:
+        """Test that plain and quoted scalars are read by the line scan."""
+        self.assertEqual(
+            self.current_version("template:\n  version: 1.2.3 # pinned\n"), "1.2.3"
+        )
+        self.assertEqual(
+            self.current_version('template:\n  version: "1.2.3"\n'), "1.2.3"
+        )
+
+    def test_anchored_version(self) -> None:
+        """Test that an anchored version is resolved by the YAML parser."""
+        content = "template:\n  version: &v 1.2.3\nimage:\n  tag: *v\n"
+        self.assertEqual(self.current_version(content), "1.2.3")
+
+    def test_tagged_version(self) -> None:
+        """Test that a tagged version is resolved by the YAML parser."""
+        content = "template:\n  version: !!str 1.2.3\n"
+        self.assertEqual(self.current_version(content), "1.2.3")
+
+    def test_trailing_content(self) -> None:
+        """Test that values the line scan cannot take whole are parsed."""
+        self.assertEqual(
+            self.current_version("template:\n  version: 1.0 beta\n"), "1.0 beta"
+        )
+        self.assertEqual(self.current_version("template:\n  version: 1.0#x\n"), "1.0#x")
+
+    def test_escaped_version(self) -> None:
+        """Test that a double-quoted version with escapes is parsed."""
+        content = 'template:\n  version: "1.2\\"x"\n'
+        self.assertEqual(self.current_version(content), '1.2"x')
+
+    def test_missing_file(self) -> None:
+        """Test that a missing project.yaml reports an unknown version."""
+        manager = TemplateReleaseManager(self.project_file)
+        self.assertEqual(manager.get_current_version(), "unknown")
+
+
+class TestRegistryLabel(unittest.TestCase):
+    """Test reading image labels from the registry API."""
+
+    BASE_URL = "https://ghcr.io/v2/broadsage/scaffold"
+    TOKEN_URL = "https://ghcr.io/token?scope=repository%3Abroadsage%2Fscaffold%3Apull"
+    CHALLENGE = (
+        'Bearer realm="https://ghcr.io/token",'
+        'scope="repository:broadsage/scaffold:pull"'
+    )
+
+    def setUp(self) -> None:
+        """Serve canned registry documents and isolate the label cache."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmpdir.name})
+        env.start()
+        self.addCleanup(env.stop)
+
+        self.challenge = self.CHALLENGE
+        self.requests: List[str] = []
+        self.documents: Dict[str, Any] = {
+            self.TOKEN_URL: {"token": "secret"},
+            f"{self.BASE_URL}/manifests/latest": {
+                "manifests": [
+                    {"digest": "sha256:arm", "platform": {"os": "windows"}},
+                    {"digest": "sha256:img", "platform": {"os": "linux"}},
+                ]
+            },
+            f"{self.BASE_URL}/manifests/sha256:img": {
+                "config": {"digest": "sha256:cfg"}
+            },
+            f"{self.BASE_URL}/blobs/sha256:cfg": {
+                "config": {"Labels": {release.VERSION_LABEL: "2.1.0"}}
+            },
+        }
+        urlopen = mock.patch("release.urllib.request.urlopen", self.urlopen)
+        urlopen.start()
+        self.addCleanup(urlopen.stop)
+
+    def urlopen(self, url: Any, timeout: float) -> io.BytesIO:
+        """Answer like a registry that wants a bearer token for API calls."""
+        if isinstance(url, urllib.request.Request):
+            url, token = url.full_url, url.get_header("Authorization")
+            if token != "Bearer secret":
+                headers = email.message.Message()
+                headers["WWW-Authenticate"] = self.challenge
+                raise urllib.error.HTTPError(url, 401, "Unauthorized", headers, None)
+        self.requests.append(url)
+        return io.BytesIO(json.dumps(self.documents[url]).encode("utf-8"))
+
+    def fetch_label(self) -> Any:
+        """Fetch the version label of the latest image."""
+        return release._fetch_registry_label(
+            "ghcr.io/broadsage/scaffold", "latest", release.VERSION_LABEL
+        )
+
+    def test_label_from_multi_arch_index(self) -> None:
+        """Test the token exchange and the index, manifest and config chain."""
+        self.assertEqual(self.fetch_label(), "2.1.0")
+        self.assertEqual(
+            self.requests,
+            [
+                self.TOKEN_URL,
+                f"{self.BASE_URL}/manifests/latest",
+                f"{self.BASE_URL}/manifests/sha256:img",
+                f"{self.BASE_URL}/blobs/sha256:cfg",
+            ],
+        )
+
+    def test_labels_cached_by_digest(self) -> None:
+        """Test that an unchanged image only costs the manifest request."""
+        self.fetch_label()
+        self.requests.clear()
+        self.assertEqual(self.fetch_label(), "2.1.0")
+        self.assertEqual(
+            self.requests, [self.TOKEN_URL, f"{self.BASE_URL}/manifests/latest"]
+        )
+
+    def test_missing_label(self) -> None:
+        """Test that an image without the label yields None."""
+        self.documents[f"{self.BASE_URL}/blobs/sha256:cfg"] = {"config": {}}
+        self.assertIsNone(self.fetch_label())
+
+    def test_non_https_realm_refused(self) -> None:
+        """Test that a token realm with another scheme is never opened."""
+        self.challenge = 'Bearer realm="file:///etc/passwd",scope="x"'
+        with self.assertRaises(ValueError):
+            self.fetch_label()
+        self.assertEqual(self.requests, [])
+
+    def test_non_https_url_refused(self) -> None:
+        """Test that registry URLs must use https."""
+        with self.assertRaises(ValueError):
+            release._urlopen_https("http://ghcr.io/v2/")
+        self.assertEqual(self.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,18 +14,457 @@ This script manages versioning for multiple components:
 Supports checking for updates and updating versions while preserving configuration.
 """
 
+import functools
+import io
+import json
+import os
+import re
 import subprocess
 import sys
+import tarfile
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+# A local image pulled more recently than this is reused without pulling
+PULL_TTL_SECONDS = 3600
+
+# OCI label carrying the template version in published images
+VERSION_LABEL = "org.opencontainers.image.version"
+
+# Registry API settings
+REGISTRY_TIMEOUT = 10
+DOCKER_HUB_REGISTRY = "registry-1.docker.io"
+MANIFEST_MEDIA_TYPES = ", ".join(
+    [
+        "application/vnd.oci.image.index.v1+json",
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.manifest.v1+json",
+        "application/vnd.docker.distribution.manifest.v2+json",
+    ]
+)
+
+# Placeholder results returned when a version cannot be determined
+_VERSION_SENTINELS: FrozenSet[str] = frozenset({"latest", "unknown", ""})
+
+# Top-level "template:" key opening a block mapping
+_TEMPLATE_KEY_RE = re.compile(r"template\s*:\s*(#.*)?$")
+
+# Indented "version: <scalar>" entry, plain or quoted, followed by nothing
+# but whitespace and an optional comment
+_VERSION_KEY_RE = re.compile(
+    r"""\s+version\s*:\s*(?:"([^"]*)"|'([^']*)'|([^\s"']\S*))(?:\s+#.*)?\s*$"""
+)
+
+# Plain values starting with an anchor, alias, tag, flow collection or
+# block scalar indicator need the full YAML parser
+_YAML_INDICATORS: FrozenSet[str] = frozenset("&*!{[|>")
+
+
+def _split_image_name(docker_image: str) -> Tuple[str, str]:
+    """
+    Split an image name into registry host and repository path.
+
+    Args:
+        docker_image: Docker image name without tag
+
+    Returns:
+        Tuple of (registry host, repository path)
+    """
+    host, _, path = docker_image.partition("/")
+    if path and ("." in host or ":" in host or host == "localhost"):
+        return host, path
+    if not path:
+        return DOCKER_HUB_REGISTRY, f"library/{docker_image}"
+    return DOCKER_HUB_REGISTRY, docker_image
+
+
+def _urlopen_https(url: Union[str, urllib.request.Request]) -> Any:
+    """
+    Open an HTTPS URL, refusing any other scheme.
+
+    Token realms come from the registry's WWW-Authenticate header, so they
+    are checked here before urllib gets to handle file:// and similar URLs.
+
+    Args:
+        url: URL or prepared request
+
+    Returns:
+        The open response
+
+    Raises:
+        ValueError: If the URL does not use https
+    """
+    full_url = url.full_url if isinstance(url, urllib.request.Request) else url
+    if urllib.parse.urlsplit(full_url).scheme != "https":
+        raise ValueError(f"Refusing non-HTTPS registry URL: {full_url}")
+    # Scheme checked above
+    return urllib.request.urlopen(url, timeout=REGISTRY_TIMEOUT)  # nosec B310
+
+
+def _registry_get_json(url: str, accept: str, auth: Dict[str, str]) -> Any:
+    """
+    GET a registry API document, answering one bearer-token challenge.
+
+    Args:
+        url: Registry API URL
+        accept: Accept header value
+        auth: Mutable holder for the bearer token, shared across requests
+
+    Returns:
+        Decoded JSON document
+    """
+    request = urllib.request.Request(url, headers={"Accept": accept})
+    if "token" in auth:
+        # Unredirected, so the token never leaks to blob storage redirects
+        request.add_unredirected_header("Authorization", f"Bearer {auth['token']}")
+
+    try:
+        with _urlopen_https(request) as response:
+            return json.load(response)
+    except urllib.error.HTTPError as e:
+        challenge = e.headers.get("WWW-Authenticate", "")
+        if e.code != 401 or "token" in auth or not challenge.startswith("Bearer "):
+            raise
+
+    # Anonymous token for public images, as requested by the challenge
+    params = dict(re.findall(r'(\w+)="([^"]*)"', challenge))
+    realm = params.pop("realm")
+    token_url = f"{realm}?{urllib.parse.urlencode(params)}"
+    with _urlopen_https(token_url) as response:
+        payload = json.load(response)
+    auth["token"] = payload.get("token") or payload.get("access_token", "")
+    return _registry_get_json(url, accept, auth)
+
+
+def _cache_dir() -> Optional[Path]:
+    """
+    Resolve the per-user cache directory for release lookups.
+
+    Resolved on use rather than at import: containers started with
+    ``--user <uid>`` may have neither HOME nor a passwd entry, and commands
+    that never touch the cache must still work there.
+
+    Returns:
+        Cache directory, or None if no home directory can be determined
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    try:
+        base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    except (RuntimeError, KeyError):
+        return None
+    return base / "docker-scaffold"
+
+
+def _label_cache_file(digest: str) -> Optional[Path]:
+    """
+    Path of the cached labels for an image digest.
+
+    Args:
+        digest: Content digest of the image (e.g. "sha256:...")
+
+    Returns:
+        Cache file path, or None if there is no cache directory
+    """
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    return cache_dir / "labels" / (re.sub(r"[^\w.-]", "_", digest) + ".json")
+
+
+def _read_cached_labels(digest: str) -> Optional[Dict[str, str]]:
+    """
+    Load the labels recorded for an image digest.
+
+    Digests are content addresses, so an entry never goes stale.
+
+    Args:
+        digest: Content digest of the image
+
+    Returns:
+        Labels dict, or None if nothing is cached
+    """
+    cache_file = _label_cache_file(digest)
+    if cache_file is None:
+        return None
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            labels = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return labels if isinstance(labels, dict) else None
+
+
+def _write_cached_labels(digest: str, labels: Dict[str, str]) -> None:
+    """
+    Record the labels of an image digest (best effort).
+
+    Args:
+        digest: Content digest of the image
+        labels: Image labels from its config blob
+    """
+    cache_file = _label_cache_file(digest)
+    if cache_file is None:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(labels, f)
+    except OSError:
+        pass
+
+
+def _fetch_registry_label(docker_image: str, tag: str, label: str) -> Optional[str]:
+    """
+    Read an image label straight from the registry.
+
+    Only the manifest and the small image config blob are fetched; no
+    layers are downloaded and no container is started. Labels are cached
+    by image digest, so an unchanged tag costs a single manifest request.
+
+    Args:
+        docker_image: Docker image name without tag
+        tag: Image tag
+        label: Label name
+
+    Returns:
+        Label value, or None if the image does not carry it
+    """
+    registry, repository = _split_image_name(docker_image)
+    base_url = f"https://{registry}/v2/{repository}"
+    auth: Dict[str, str] = {}
+
+    manifest = _registry_get_json(
+        f"{base_url}/manifests/{tag}", MANIFEST_MEDIA_TYPES, auth
+    )
+    if "manifests" in manifest:
+        # Multi-arch index: every platform image carries the same labels
+        images = [
+            entry
+            for entry in manifest["manifests"]
+            if entry.get("platform", {}).get("os") == "linux"
+        ]
+        if not images:
+            return None
+        digest = images[0]["digest"]
+        labels = _read_cached_labels(digest)
+        if labels is None:
+            manifest = _registry_get_json(
+                f"{base_url}/manifests/{digest}", MANIFEST_MEDIA_TYPES, auth
+            )
+    else:
+        digest = manifest["config"]["digest"]
+        labels = _read_cached_labels(digest)
+
+    if labels is None:
+        config = _registry_get_json(
+            f"{base_url}/blobs/{manifest['config']['digest']}", "*/*", auth
+        )
+        labels = (config.get("config") or {}).get("Labels") or {}
+        _write_cached_labels(digest, labels)
+
+    value = labels.get(label)
+    return str(value) if value else None
+
+
+def _pull_if_stale(image_ref: str) -> None:
+    """
+    Pull an image unless a recent pull of it is still present locally.
+
+    A stamp file in the cache directory records when the image was last
+    pulled; within PULL_TTL_SECONDS the pull (a registry round-trip, subject
+    to rate limits) is skipped as long as the image still exists locally.
+    Without a cache directory the image is always pulled.
+
+    Args:
+        image_ref: Fully qualified image reference including tag
+    """
+    cache_dir = _cache_dir()
+    stamp = (
+        cache_dir / (re.sub(r"[^\w.-]", "_", image_ref) + ".pulled")
+        if cache_dir is not None
+        else None
+    )
+    try:
+        fresh = (
+            stamp is not None and time.time() - stamp.stat().st_mtime < PULL_TTL_SECONDS
+        )
+    except OSError:
+        fresh = False
+
+    if fresh:
+        inspect = subprocess.run(
+            ["docker", "image", "inspect", image_ref],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        if inspect.returncode == 0:
+            return
+
+    # Pull latest image quietly
+    pull = subprocess.run(
+        ["docker", "pull", image_ref],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    if pull.returncode == 0 and stamp is not None:
+        try:
+            stamp.parent.mkdir(parents=True, exist_ok=True)
+            stamp.touch()
+        except OSError:
+            pass
+
+
+def _read_local_label(image_ref: str, label: str) -> Optional[str]:
+    """
+    Read an image label from the local image metadata.
+
+    ``docker image inspect`` only reads metadata, so no container is
+    created or started.
+
+    Args:
+        image_ref: Fully qualified image reference including tag
+        label: Label name
+
+    Returns:
+        Label value, or None if the image does not carry it
+    """
+    inspect = subprocess.run(
+        ["docker", "image", "inspect", image_ref],
+        capture_output=True,
+        check=False,
+    )
+    if inspect.returncode != 0:
+        return None
+
+    try:
+        images = json.loads(inspect.stdout)
+    except ValueError:
+        return None
+    config = (images[0].get("Config") or {}) if images else {}
+    value = (config.get("Labels") or {}).get(label)
+    # Local builds without a VERSION build arg carry the placeholder label
+    return str(value) if value and value != "dev" else None
+
+
+def _read_image_file(image_ref: str, path: str) -> Optional[bytes]:
+    """
+    Read a single file from an image without starting a container.
+
+    Creates a stopped container, streams the file out with ``docker cp``
+    (which emits a tar archive) and removes the container again.
+
+    Args:
+        image_ref: Fully qualified image reference including tag
+        path: Absolute path of the file inside the image
+
+    Returns:
+        File contents, or None if the file could not be read
+    """
+    create = subprocess.run(
+        ["docker", "create", image_ref],
+        capture_output=True,
+        check=False,
+    )
+    if create.returncode != 0:
+        return None
+
+    container_id = create.stdout.strip().decode("ascii")
+    try:
+        copy = subprocess.run(
+            ["docker", "cp", f"{container_id}:{path}", "-"],
+            capture_output=True,
+            check=False,
+        )
+        if copy.returncode != 0:
+            return None
+
+        with tarfile.open(fileobj=io.BytesIO(copy.stdout)) as archive:
+            member = archive.next()
+            content = archive.extractfile(member) if member else None
+            return content.read() if content else None
+    finally:
+        subprocess.run(
+            ["docker", "rm", container_id],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _fetch_latest_version(docker_image: str) -> str:
+    """
+    Resolve the version of the latest published image.
+
+    Prefers the version label from the registry (no pull, no container);
+    falls back to the label of a local copy, then to its VERSION file.
+
+    Cached so combined flows (e.g. ``update`` after ``check``) pay for the
+    docker round-trip only once per image.
+
+    Args:
+        docker_image: Docker image name without tag
+
+    Returns:
+        Latest version string or "latest" if cannot determine
+    """
+    try:
+        version = _fetch_registry_label(docker_image, "latest", VERSION_LABEL)
+        if version:
+            return version
+    except Exception:
+        pass
+
+    try:
+        _pull_if_stale(f"{docker_image}:latest")
+
+        version = _read_local_label(f"{docker_image}:latest", VERSION_LABEL)
+        if version:
+            return version
+
+        # Read VERSION file from image
+        content = _read_image_file(f"{docker_image}:latest", "/app/VERSION")
+        version = content.strip().decode("ascii") if content else None
+        if version:
+            return version
+
+        return "latest"
+    except Exception:
+        return "latest"
 
-try:
-    from ruamel.yaml import YAML
-except ImportError:
-    print("Error: ruamel.yaml is not installed", file=sys.stderr)
-    print("Install it with: pip install ruamel.yaml", file=sys.stderr)
-    sys.exit(1)
+
+@functools.lru_cache(maxsize=None)
+def _round_trip_yaml() -> Any:
+    """
+    Create the round-trip YAML handler once per process.
+
+    ruamel.yaml is imported lazily so commands that never parse
+    project.yaml (such as ``latest``) do not pay for its import.
+
+    Returns:
+        Configured ruamel.yaml YAML instance
+    """
+    try:
+        from ruamel.yaml import YAML
+    except ImportError:
+        print("Error: ruamel.yaml is not installed", file=sys.stderr)
+        print("Install it with: pip install ruamel.yaml", file=sys.stderr)
+        sys.exit(1)
+
+    yaml = YAML()
+    yaml.preserve_quotes = True
+    yaml.default_flow_style = False
+    yaml.width = 4096
+    yaml.indent(mapping=2, sequence=2, offset=0)  # type: ignore[attr-defined]
+    return yaml
 
 
 class ReleaseManager(ABC):
@@ -45,14 +484,21 @@ class ReleaseManager(ABC):
         """
         Compare current and latest versions.
 
+        The remote lookup runs in a worker thread while the local version
+        is read, so the check takes max() rather than sum() of the two.
+
         Returns:
             Dict with current, latest, and update_available status
         """
-        current = self.get_current_version()
-        latest = self.get_latest_version()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            latest_future = executor.submit(self.get_latest_version)
+            current = self.get_current_version()
+            latest = latest_future.result()
 
         update_available = (
-            current != latest and current != "latest" and latest != "latest"
+            current not in _VERSION_SENTINELS
+            and latest not in _VERSION_SENTINELS
+            and current != latest
         )
 
         return {
@@ -89,16 +535,25 @@ class TemplateReleaseManager(ReleaseManager):
         """
         self.project_file = Path(project_file)
         self.docker_image = docker_image
-        self.yaml = YAML()
-        self.yaml.preserve_quotes = True
-        self.yaml.default_flow_style = False
-        self.yaml.width = 4096
-        self.yaml.indent(mapping=2, sequence=2, offset=0)  # type: ignore[attr-defined]
+
+    @property
+    def yaml(self) -> Any:
+        """
+        Round-trip YAML handler shared by all instances.
+
+        Returns:
+            Configured ruamel.yaml YAML instance
+        """
+        return _round_trip_yaml()
 
     def get_current_version(self) -> str:
         """
         Read current template version from project.yaml.
 
+        Scans the file line by line for ``version`` directly under the
+        top-level ``template`` block; only layouts the scan does not
+        understand fall back to a read-only YAML parse.
+
         Returns:
             Current version string or "unknown" if not found
         """
@@ -106,61 +561,97 @@ class TemplateReleaseManager(ReleaseManager):
             return "unknown"
 
         try:
-            data: Any = self.yaml.load(self.project_file)  # type: ignore[assignment]
-            if "template" in data and "version" in data["template"]:
-                return str(data["template"]["version"])  # type: ignore[arg-type]
-            return "unknown"
+            version = self._scan_current_version()
+            if version is None:
+                version = self._parse_current_version()
+            return version
         except Exception:
             return "unknown"
 
-    def get_latest_version(self) -> str:
+    def _scan_current_version(self) -> Optional[str]:
         """
-        Fetch latest template version from Docker image.
+        Extract template.version from block-style YAML without parsing it.
 
         Returns:
-            Latest version string or "latest" if cannot determine
+            Version string, or None if the scan could not find it
         """
-        try:
-            # Pull latest image quietly
-            subprocess.run(
-                ["docker", "pull", f"{self.docker_image}:latest"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False,
-            )
+        with open(self.project_file, encoding="utf-8") as f:
+            in_template = False
+            child_indent: Optional[int] = None
+            for line in f:
+                stripped = line.strip()
+                if not stripped or stripped.startswith("#"):
+                    continue
+
+                # Any unindented line starts a new top-level entry
+                if not line[0].isspace():
+                    if in_template:
+                        break
+                    in_template = bool(_TEMPLATE_KEY_RE.match(line))
+                    continue
+
+                if not in_template:
+                    continue
+
+                # Only direct children of template are considered
+                indent = len(line) - len(line.lstrip())
+                if child_indent is None:
+                    child_indent = indent
+                if indent != child_indent:
+                    continue
+
+                match = _VERSION_KEY_RE.match(line)
+                if match:
+                    double, single, plain = match.groups()
+                    # Escapes and YAML indicators are left to the parser
+                    if double is not None and "\\" in double:
+                        return None
+                    if plain is not None and plain[0] in _YAML_INDICATORS:
+                        return None
+                    return next(
+                        group for group in (double, single, plain) if group is not None
+                    )
+        return None
+
+    def _parse_current_version(self) -> str:
+        """
+        Read template.version with ruamel.yaml's safe (C-backed) loader.
 
-            # Read VERSION file from image
-            result = subprocess.run(
-                [
-                    "docker",
-                    "run",
-                    "--rm",
-                    f"{self.docker_image}:latest",
-                    "cat",
-                    "/app/VERSION",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+        Read-only access needs none of the comment and quote preservation
+        of the round-trip loader used by update_version.
 
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
+        Returns:
+            Current version string or "unknown" if not found
+        """
+        from ruamel.yaml import YAML
 
-            return "latest"
-        except Exception:
-            return "latest"
+        data: Any = YAML(typ="safe").load(self.project_file)
+        template = data.get("template") if isinstance(data, dict) else None
+        if isinstance(template, dict) and "version" in template:
+            return str(template["version"])
+        return "unknown"
+
+    def get_latest_version(self) -> str:
+        """
+        Fetch latest template version from Docker image.
+
+        The lookup is cached per image for the lifetime of the process.
+
+        Returns:
+            Latest version string or "latest" if cannot determine
+        """
+        return _fetch_latest_version(self.docker_image)
 
     def update_version(self, version: Optional[str] = None) -> None:
         """
         Update template version in project.yaml.
 
+        The file is parsed once and validated before the (slow) latest
+        version lookup, so a broken project.yaml fails fast.
+
         Args:
             version: Version to set, or None to use latest
         """
-        if version is None:
-            version = self.get_latest_version()
-
         if not self.project_file.exists():
             print(f"Error: File '{self.project_file}' not found", file=sys.stderr)
             sys.exit(1)
@@ -172,6 +663,9 @@ class TemplateReleaseManager(ReleaseManager):
                 print("Error: template.version not found in YAML", file=sys.stderr)
                 sys.exit(1)
 
+            if version is None:
+                version = self.get_latest_version()
+
             data["template"]["version"] = version
             self.yaml.dump(data, self.project_file)  # type: ignore[arg-type]
             print(f"✓ Updated template version to {version}")
@@ -231,6 +725,46 @@ def print_usage() -> None:
     print("  release.py template update 1.2.0", file=sys.stderr)
 
 
+def cmd_current(manager: ReleaseManager, _component: str, _args: List[str]) -> None:
+    """Print the current version."""
+    print(manager.get_current_version())
+
+
+def cmd_latest(manager: ReleaseManager, _component: str, _args: List[str]) -> None:
+    """Print the latest available version."""
+    print(manager.get_latest_version())
+
+
+def cmd_check(manager: ReleaseManager, component: str, _args: List[str]) -> None:
+    """Compare current and latest versions; exit 1 if an update is available."""
+    result = manager.check_update()
+    print(f"Current {component} version: {result['current']}")
+    print(f"Latest {component} version:  {result['latest']}")
+
+    if result["update_available"]:
+        print("")
+        print("⚠️  Updates available! Run 'task template:update' to upgrade")
+        sys.exit(1)
+
+    print("")
+    print(f"✓ {component.capitalize()} is up to date")
+    sys.exit(0)
+
+
+def cmd_update(manager: ReleaseManager, _component: str, args: List[str]) -> None:
+    """Update to the given version, or latest if none is given."""
+    manager.update_version(args[0] if args else None)
+
+
+# CLI command name -> handler
+COMMANDS: Dict[str, Callable[[ReleaseManager, str, List[str]], None]] = {
+    "current": cmd_current,
+    "latest": cmd_latest,
+    "check": cmd_check,
+    "update": cmd_update,
+}
+
+
 def main() -> None:
     """Main CLI entry point."""
     if len(sys.argv) < 3:
@@ -239,7 +773,13 @@ def main() -> None:
 
     component = sys.argv[1]
     command = sys.argv[2]
-    command_args = sys.argv[3:] if len(sys.argv) > 3 else []
+    command_args = sys.argv[3:]
+
+    handler = COMMANDS.get(command)
+    if handler is None:
+        print(f"Error: Unknown command '{command}'", file=sys.stderr)
+        print_usage()
+        sys.exit(1)
 
     # Create appropriate manager
     try:
@@ -250,34 +790,7 @@ def main() -> None:
         sys.exit(1)
 
     # Execute command
-    if command == "current":
-        print(manager.get_current_version())
-
-    elif command == "latest":
-        print(manager.get_latest_version())
-
-    elif command == "check":
-        result = manager.check_update()
-        print(f"Current {component} version: {result['current']}")
-        print(f"Latest {component} version:  {result['latest']}")
-
-        if result["update_available"]:
-            print("")
-            print("⚠️  Updates available! Run 'task template:update' to upgrade")
-            sys.exit(1)
-        else:
-            print("")
-            print(f"✓ {component.capitalize()} is up to date")
-            sys.exit(0)
-
-    elif command == "update":
-        version = command_args[0] if command_args else None
-        manager.update_version(version)
-
-    else:
-        print(f"Error: Unknown command '{command}'", file=sys.stderr)
-        print_usage()
-        sys.exit(1)
+    handler(manager, component, command_args)
 
 
 if __name__ == "__main__":